@@ -1,4 +1,6 @@
+import random
 import unittest
+from unittest import mock
 # Importa a classe a ser testada (assumindo que ela está no arquivo statistics.py)
 from food_statistics import Statistics
 
@@ -111,6 +113,108 @@ class TestStatistics(unittest.TestCase):
         # P(X=1 | X=4) -> '4' não existe, contagem do condicionante é 0
         self.assertEqual(self.stats.conditional_probability('sequencial', 1, 4), 0.0)
 
+    def test_missing_values(self):
+        """Testa se os valores ausentes (None e NaN) são ignorados pelas métricas."""
+        null_data = {
+            'x': [1, None, 3, float('nan'), 5, 2],
+            'y': [2, 4, None, 8, 10, 4],
+            'c': ['A', None, 'B', 'A', None, 'B'],
+        }
+        null_stats = Statistics(null_data)
+        self.assertEqual(null_stats.null_count('x'), 2)
+        self.assertEqual(null_stats.null_count('c'), 2)
+        # valores válidos de x: [1, 3, 5, 2]
+        self.assertAlmostEqual(null_stats.mean('x'), 2.75)
+        self.assertAlmostEqual(null_stats.median('x'), 2.5)
+        self.assertAlmostEqual(null_stats.variance('x'), 2.1875)
+        self.assertAlmostEqual(null_stats.stdev('x'), 2.1875 ** 0.5)
+        self.assertEqual(null_stats.itemset('c'), {'A', 'B'})
+        self.assertEqual(null_stats.absolute_frequency('c'), {'A': 2, 'B': 2})
+        self.assertEqual(null_stats.relative_frequency('c'), {'A': 0.5, 'B': 0.5})
+        self.assertEqual(null_stats.cumulative_frequency('c'), {'A': 2, 'B': 4})
+        self.assertEqual(sorted(null_stats.mode('c')), ['A', 'B'])
+        # a coluna original não é alterada
+        self.assertEqual(null_data['c'], ['A', None, 'B', 'A', None, 'B'])
+
+    def test_covariance_pairwise_complete(self):
+        """Testa se a covariância usa apenas as linhas completas nas duas colunas."""
+        null_stats = Statistics({'x': [1, None, 2, 3, 4, 9], 'y': [4, 7, 2, 3, 1, None]})
+        # linhas completas: x = [1, 2, 3, 4], y = [4, 2, 3, 1] -> cov = -1.0
+        self.assertAlmostEqual(null_stats.covariance('x', 'y'), -1.0)
+        self.assertEqual(Statistics({'x': [None, 1], 'y': [2, None]}).covariance('x', 'y'), 0.0)
+
+    def test_conditional_probability_with_missing_values(self):
+        """Testa se os valores ausentes interrompem as transições da sequência."""
+        # o valor ausente interrompe a sequência (1, None, 2): esse '1' não
+        # entra no denominador. Contagem de '1': 2, sequência (1, 2): 1
+        null_stats = Statistics({'seq': [1, 2, 1, None, 2, 1]})
+        self.assertAlmostEqual(null_stats.conditional_probability('seq', 2, 1), 0.5)
+        null_stats = Statistics({'seq': [1, None, 1, 2]})
+        self.assertAlmostEqual(null_stats.conditional_probability('seq', 2, 1), 1.0)
+        # valores ausentes não são eventos nem condicionantes
+        self.assertEqual(null_stats.conditional_probability('seq', None, 1), 0.0)
+        self.assertEqual(null_stats.conditional_probability('seq', float('nan'), 1), 0.0)
+        null_stats = Statistics({'seq': [1, None, 2, None, 1, None]})
+        self.assertEqual(null_stats.conditional_probability('seq', None, 1), 0.0)
+        self.assertEqual(null_stats.conditional_probability('seq', 2, None), 0.0)
+
+    def test_missing_values_snapshot(self):
+        """Testa se alterações nas listas originais não afetam o objeto."""
+        data = {'x': [1, None, 3]}
+        null_stats = Statistics(data)
+        data['x'][1] = 100
+        data['x'].append(None)
+        self.assertAlmostEqual(null_stats.mean('x'), 2.0)
+        self.assertEqual(null_stats.null_count('x'), 1)
+        with self.assertRaises(TypeError):
+            null_stats.dataset['x'] = [5]
+
+    def test_bootstrap(self):
+        """Testa os intervalos de confiança bootstrap e a reprodutibilidade pela semente."""
+        for metric in ('mean', 'median'):
+            result = self.stats.bootstrap(metric, 'inteiros', n_resamples=200, seed=42)
+            self.assertLessEqual(result['lower'], result['estimate'])
+            self.assertLessEqual(result['estimate'], result['upper'])
+            self.assertEqual(result, self.stats.bootstrap(metric, 'inteiros', n_resamples=200, seed=42))
+
+        result = self.stats.bootstrap('covariance', 'inteiros', 'floats', n_resamples=200, seed=42)
+        self.assertAlmostEqual(result['estimate'], self.stats.covariance('inteiros', 'floats'))
+        self.assertLess(result['lower'], result['upper'])
+        self.assertLessEqual(result['lower'], result['estimate'])
+        self.assertLessEqual(result['estimate'], result['upper'])
+
+        # uma coluna constante não tem variabilidade
+        constant = Statistics({'c': [3, 3, None, 3]}).bootstrap('mean', 'c', n_resamples=50, seed=1)
+        self.assertEqual(constant, {'estimate': 3.0, 'lower': 3.0, 'upper': 3.0})
+
+    def test_bootstrap_covariance_with_offset(self):
+        """Testa a covariância bootstrap com valores de deslocamento grande."""
+        rng = random.Random(0)
+        offset_data = {
+            'x': [1e9 + rng.random() for _ in range(1000)],
+            'y': [1e9 + rng.random() for _ in range(1000)],
+        }
+        offset_stats = Statistics(offset_data)
+        result = offset_stats.bootstrap('covariance', 'x', 'y', n_resamples=200, seed=1)
+        self.assertLessEqual(result['lower'], result['estimate'])
+        self.assertLessEqual(result['estimate'], result['upper'])
+        self.assertLess(result['upper'] - result['lower'], 0.1)
+
+    def test_bootstrap_pure_python_fallback(self):
+        """Testa o bootstrap sem o numpy, usando o laço em Python puro."""
+        with mock.patch('food_statistics.np', None):
+            for metric, column_b in (('mean', None), ('median', None), ('covariance', 'floats')):
+                result = self.stats.bootstrap(metric, 'inteiros', column_b, n_resamples=200, seed=42)
+                self.assertLessEqual(result['lower'], result['estimate'])
+                self.assertLessEqual(result['estimate'], result['upper'])
+                self.assertEqual(result, self.stats.bootstrap(metric, 'inteiros', column_b, n_resamples=200, seed=42))
+
+    def test_bootstrap_workers_reproducible(self):
+        """Testa se o pool de processos gera o mesmo resultado do cálculo sequencial."""
+        serial = self.stats.bootstrap('median', 'floats', n_resamples=120, seed=7, batch_size=25)
+        parallel = self.stats.bootstrap('median', 'floats', n_resamples=120, seed=7, batch_size=25, workers=2)
+        self.assertEqual(serial, parallel)
+
     # ==================================================================
     # Testes de Casos de Exceção
     # ==================================================================
@@ -163,6 +267,23 @@ class TestStatistics(unittest.TestCase):
         self.assertEqual(empty_stats.relative_frequency('vazia'), {})
         self.assertEqual(empty_stats.cumulative_frequency('vazia'), {})
 
+    def test_bootstrap_invalid_arguments(self):
+        """Testa as exceções do bootstrap para argumentos inválidos."""
+        with self.assertRaisesRegex(ValueError, "O 'metric' deve ser 'mean', 'median' ou 'covariance'."):
+            self.stats.bootstrap('moda', 'inteiros')
+        with self.assertRaises(ValueError):
+            self.stats.bootstrap('covariance', 'inteiros')
+        with self.assertRaises(ValueError):
+            self.stats.bootstrap('mean', 'inteiros', confidence=1.5)
+        with self.assertRaises(TypeError):
+            self.stats.bootstrap('mean', 'categorica')
+        with self.assertRaisesRegex(ValueError, "A coluna 'column_b' só é usada pela 'covariance'."):
+            self.stats.bootstrap('median', 'inteiros', 'floats')
+        with self.assertRaises(ValueError):
+            self.stats.bootstrap('mean', 'inteiros', seed=-1)
+        with self.assertRaisesRegex(TypeError, "O 'n_resamples' e o 'batch_size' devem ser inteiros."):
+            self.stats.bootstrap('mean', 'inteiros', n_resamples=2.5)
+
     def test_cumulative_frequency_invalid_method(self):
         """Testa a exceção para um método de frequência inválido."""
         with self.assertRaisesRegex(ValueError, "O 'frequency_method' deve ser 'absolute' ou 'relative'."):